@@ -1,33 +1,124 @@
-from flask import Flask, render_template, request, jsonify, flash, redirect, url_for
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
+from quart import Quart, render_template, request, jsonify
+from quart.json.provider import JSONProvider
+from quart_rate_limiter import RateLimiter, RateLimit, RateLimitExceeded, rate_limit
+from quart_rate_limiter.redis_store import RedisStore
+import httpx
 import openai
+from openai import AsyncOpenAI
+from tenacity import retry, wait_random_exponential, stop_after_attempt, retry_if_exception_type
 import os
 from werkzeug.utils import secure_filename
+from cachetools import TTLCache
+from pydantic import BaseModel, BeforeValidator, Field, ValidationError
+from typing import Annotated
+import asyncio
+import codecs
+import functools
+import hashlib
+import math
+import orjson
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-app = Flask(__name__)
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes responses with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
-# Configure rate limiting
-limiter = Limiter(
-    app=app,
-    key_func=get_remote_address,
-    default_limits=["200 per day", "50 per hour"]
+async def client_address_key():
+    """Identify clients by the connecting peer's address.
+
+    quart-rate-limiter's default key trusts the client-supplied X-Forwarded-For
+    header. remote_addr is only taken from that header by the server (Uvicorn's
+    forwarded_allow_ips) when a trusted proxy sent it.
+    """
+    return request.remote_addr
+
+# Configure rate limiting (shared through Redis when REDIS_URL is set so all workers see the same counters)
+REDIS_URL = os.environ.get('REDIS_URL')
+limiter = RateLimiter(
+    app,
+    key_function=client_address_key,
+    store=RedisStore(REDIS_URL) if REDIS_URL else None
 )
 
-# Configure OpenAI
-openai.api_key = os.environ.get('OPENAI_API_KEY')
+# Limits for routes without their own @rate_limit. quart-rate-limiter's default_limits
+# would stack onto every route (and static files), so they are applied explicitly.
+DEFAULT_LIMITS = [
+    RateLimit(200, timedelta(days=1)),
+    RateLimit(50, timedelta(hours=1))
+]
+
+# OpenAI calls allowed per client, shared by /process, /process/stream and /process/batch
+PROCESSING_LIMIT = RateLimit(10, timedelta(minutes=1))
+
+async def consume_processing_quota(cost=1):
+    """Charge cost OpenAI calls against the client's shared processing limit.
+
+    Uses the same GCRA scheme and store as the route limits, but a single key per
+    client for all processing routes, so a batch of N texts counts as N calls.
+    Raises RateLimitExceeded (429) when the limit would be exceeded.
+
+    quart-rate-limiter has no public API for weighted limits, so this mirrors its
+    private RateLimiter._raise_on_rejection/_update_limits as of version 0.12.1.
+    Re-check it against the library when upgrading.
+    """
+    if not app.config['QUART_RATE_LIMITER_ENABLED']:
+        return
+    
+    key = f"{app.import_name}-processing-{PROCESSING_LIMIT.key}-{await limiter.key_function()}"
+    now = datetime.now(timezone.utc)
+    stored = await limiter.store.get(key, now)
+    if stored.tzinfo is None:
+        stored = stored.astimezone(timezone.utc)
+    
+    # tat is the theoretical arrival time; each call pushes it forward by one interval
+    new_tat = max(stored, now) + timedelta(seconds=PROCESSING_LIMIT.inverse * cost)
+    allowed_at = new_tat - PROCESSING_LIMIT.period
+    if allowed_at > now:
+        raise RateLimitExceeded(math.ceil((allowed_at - now).total_seconds()))
+    await limiter.store.set(key, new_tat)
+
+# Configure OpenAI (one client shared by all requests so connections are reused)
+OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    timeout=60.0
+)
+# Retries are handled by call_openai, so the SDK's own retries are disabled
+client = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client, max_retries=0) if OPENAI_API_KEY else None
+
+@app.after_serving
+async def close_http_client():
+    await http_client.aclose()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keep the OpenAI SDK and its HTTP client from logging every request at INFO
+logging.getLogger('openai').setLevel(logging.WARNING)
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
 # File upload configuration
 UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'txt', 'md'}
+ALLOWED_EXTENSIONS = frozenset({'.txt', '.md'})
 MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB max file size
+MAX_TEXT_LENGTH = 10000  # Max characters sent for processing
+FILE_READ_CHUNK_SIZE = 8192
+MAX_BATCH_ITEMS = 10  # Max texts per /process/batch request (one minute of processing quota)
+BATCH_CONCURRENCY = 10  # Max concurrent OpenAI calls per batch
+MAX_OUTPUT_TOKENS = 2000
+MIN_OUTPUT_TOKENS = 200
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
@@ -35,178 +126,492 @@ app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 # Ensure upload directory exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Cache processed results for identical text + slider combinations
+RESULT_CACHE_SIZE = 2048
+RESULT_CACHE_TTL = 3600  # 1 hour
+result_cache = TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
+
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
 
-def validate_slider_values(data):
-    """Validate that all slider values are integers between 0-10"""
-    required_params = ['faithfulness', 'human_like', 'ai_like', 'formality']
+def read_text_file(file, max_length=MAX_TEXT_LENGTH):
+    """Decode an uploaded file as UTF-8, stopping once max_length is exceeded.
+
+    At most max_length plus one chunk of characters is decoded, so callers can
+    detect oversized files without reading them fully. Raises UnicodeDecodeError
+    for invalid UTF-8.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    parts = []
+    length = 0
+    while length <= max_length:
+        chunk = file.stream.read(FILE_READ_CHUNK_SIZE)
+        text = decoder.decode(chunk, final=not chunk)
+        parts.append(text)
+        length += len(text)
+        if not chunk:
+            break
+    return "".join(parts)
+
+def parse_slider_value(value):
+    """Convert integer strings (form values) with int(); bools are rejected"""
+    if isinstance(value, bool):
+        raise ValueError("must be a valid number")
+    if isinstance(value, str):
+        return int(value)
+    return value
+
+# Strict so that pydantic does not coerce floats, "5.0" or bools the way lax mode would
+SliderValue = Annotated[int, BeforeValidator(parse_slider_value), Field(ge=0, le=10, strict=True)]
+
+class Sliders(BaseModel):
+    """Slider values controlling how a text is processed, each an integer between 0-10"""
+    faithfulness: SliderValue
+    human_like: SliderValue
+    ai_like: SliderValue
+    formality: SliderValue
     
-    for param in required_params:
-        try:
-            value = int(data.get(param, 0))
-            if not 0 <= value <= 10:
-                return False, f"{param} must be between 0 and 10"
-        except (ValueError, TypeError):
-            return False, f"{param} must be a valid number"
+    def as_tuple(self):
+        return (self.faithfulness, self.human_like, self.ai_like, self.formality)
+
+def validate_slider_values(data):
+    """Validate that all slider values are integers between 0-10.
+
+    Returns (slider values tuple, None) when valid, otherwise (None, error message).
+    """
+    values = {param: data.get(param) for param in Sliders.model_fields if data.get(param) is not None}
+    try:
+        sliders = Sliders(**values)
+    except ValidationError as e:
+        error = e.errors()[0]
+        param = error['loc'][0]
+        if error['type'] == 'missing':
+            return None, f"{param} is required"
+        if error['type'] in ('greater_than_equal', 'less_than_equal'):
+            return None, f"{param} must be between 0 and 10"
+        return None, f"{param} must be a valid number"
     
-    return True, None
+    return sliders.as_tuple(), None
+
+def estimate_max_tokens(text):
+    """Estimate the completion budget for rewriting text.
+
+    The rewrite is roughly as long as the input, so the budget is the input's
+    estimated token count plus headroom. UTF-8 bytes / 4 is used instead of
+    characters so scripts with more tokens per character (e.g. CJK) are not
+    truncated.
+    """
+    estimated_input_tokens = len(text.encode('utf-8')) // 4
+    return min(MAX_OUTPUT_TOKENS, max(MIN_OUTPUT_TOKENS, int(estimated_input_tokens * 1.5)))
+
+def make_cache_key(text, faithfulness, human_like, ai_like, formality):
+    """Build the result cache key for a text and its slider values"""
+    return hashlib.sha256(
+        f"{faithfulness}|{human_like}|{ai_like}|{formality}|{text}".encode('utf-8')
+    ).digest()
+
+# Prompt text for each slider, indexed by bucket (0-2 low, 3-5 medium, 6-10 high)
+FAITHFULNESS_INSTRUCTIONS = (
+    "Make significant changes and improvements to the content while preserving core meaning.",
+    "Make moderate changes to improve clarity and flow while keeping most original content.",
+    "Make minimal changes, focusing only on essential corrections and improvements."
+)
+HUMAN_LIKE_INSTRUCTIONS = (
+    "Use very natural, conversational language appropriate for the detected language with contractions and casual expressions.",
+    "Use moderately natural language that sounds human but polished in the detected language.",
+    "Use highly natural, warm, and engaging human language with personality in the detected language."
+)
+AI_LIKE_INSTRUCTIONS = (
+    "Avoid any mechanical or robotic phrasing; sound completely human in the detected language.",
+    "Use some structured phrasing but maintain natural flow in the detected language.",
+    "Use precise, structured language that sounds more systematic and analytical in the detected language."
+)
+FORMALITY_INSTRUCTIONS = (
+    "Use very casual, informal language appropriate for friends or social media in the detected language.",
+    "Use moderately formal language suitable for business communication in the detected language.",
+    "Use highly formal, academic or professional language in the detected language."
+)
+
+PROMPT_PREFIX_TEMPLATE = (
+    "Please process the following text according to these specific parameters. IMPORTANT: Detect the language of the input text and respond in the SAME language."
+    "\n**Faithfulness to Original (Level {faithfulness}/10):**{faithfulness_instruction}"
+    "\n**Human-like Sound (Level {human_like}/10):**{human_like_instruction}"
+    "\n**AI-like Sound (Level {ai_like}/10):**{ai_like_instruction}"
+    "\n**Formality Level (Level {formality}/10):**{formality_instruction}"
+)
+SYSTEM_MESSAGE = {"role": "system", "content": "You are an expert multilingual writing coach and text editor with deep expertise in grammar, style, clarity, and tone across all languages. You excel at improving text while respecting the author's voice, intent, and cultural context. You always respond in the same language as the input text and follow the given parameters precisely to enhance the provided text with professional writing standards appropriate for that language and culture."}
+PROMPT_INSTRUCTIONS = "**Instructions:** Apply the above parameters to rewrite this text in the SAME language as the input. Maintain all cultural and linguistic nuances appropriate for that language. Return only the processed text without explanations."
+
+def slider_bucket(value):
+    """Map a slider value to its instruction bucket (low, medium, high)"""
+    return 0 if value <= 2 else 1 if value <= 5 else 2
+
+@functools.lru_cache(maxsize=None)
+def create_prompt_prefix(faithfulness, human_like, ai_like, formality):
+    """Create the slider section of the prompt (cached, only 11^4 combinations)"""
+    return PROMPT_PREFIX_TEMPLATE.format(
+        faithfulness=faithfulness,
+        faithfulness_instruction=FAITHFULNESS_INSTRUCTIONS[slider_bucket(faithfulness)],
+        human_like=human_like,
+        human_like_instruction=HUMAN_LIKE_INSTRUCTIONS[slider_bucket(human_like)],
+        ai_like=ai_like,
+        ai_like_instruction=AI_LIKE_INSTRUCTIONS[slider_bucket(ai_like)],
+        formality=formality,
+        formality_instruction=FORMALITY_INSTRUCTIONS[slider_bucket(formality)]
+    )
 
 def create_processing_prompt(text, faithfulness, human_like, ai_like, formality):
     """Create a detailed prompt for ChatGPT based on slider values"""
+    prefix = create_prompt_prefix(faithfulness, human_like, ai_like, formality)
+    return f"{prefix}\n**Text to process:**\n{text}\n{PROMPT_INSTRUCTIONS}"
+
+def build_result(text, processed_text, faithfulness, human_like, ai_like, formality, cached):
+    """Build the JSON payload returned for a processed text"""
+    return {
+        'success': True,
+        'original_text': text,
+        'processed_text': processed_text,
+        'cached': cached,
+        'parameters': {
+            'faithfulness': faithfulness,
+            'human_like': human_like,
+            'ai_like': ai_like,
+            'formality': formality
+        }
+    }
+
+@app.route('/')
+@rate_limit(limits=DEFAULT_LIMITS)
+async def index():
+    return await render_template('index.html')
+
+async def parse_process_request():
+    """Read the text input and slider values of a process request.
+
+    Returns (text, sliders, None) when valid, otherwise (None, None, error_response).
+    """
+    form = await request.form
     
-    prompt_parts = [
-        "Please process the following text according to these specific parameters. IMPORTANT: Detect the language of the input text and respond in the SAME language.",
-        f"\n**Faithfulness to Original (Level {faithfulness}/10):**"
-    ]
+    # Validate slider values before touching the text or any uploaded file
+    sliders, error_msg = validate_slider_values(form)
+    if error_msg:
+        return None, None, (jsonify({'success': False, 'error': error_msg}), 400)
     
-    if faithfulness <= 2:
-        prompt_parts.append("Make significant changes and improvements to the content while preserving core meaning.")
-    elif faithfulness <= 5:
-        prompt_parts.append("Make moderate changes to improve clarity and flow while keeping most original content.")
-    else:
-        prompt_parts.append("Make minimal changes, focusing only on essential corrections and improvements.")
+    # Get text input (either from form or file upload)
+    text_input = form.get('text_input', '').strip()
     
-    prompt_parts.append(f"\n**Human-like Sound (Level {human_like}/10):**")
-    if human_like <= 2:
-        prompt_parts.append("Use very natural, conversational language appropriate for the detected language with contractions and casual expressions.")
-    elif human_like <= 5:
-        prompt_parts.append("Use moderately natural language that sounds human but polished in the detected language.")
-    else:
-        prompt_parts.append("Use highly natural, warm, and engaging human language with personality in the detected language.")
+    # Only read an uploaded file when no text was submitted
+    if not text_input:
+        files = await request.files
+        file = files.get('file')
+        if file and file.filename and allowed_file(file.filename):
+            try:
+                filename = secure_filename(file.filename)
+                text_input = read_text_file(file)
+            except UnicodeDecodeError:
+                return None, None, (jsonify({
+                    'success': False, 
+                    'error': 'File must be valid UTF-8 text'
+                }), 400)
     
-    prompt_parts.append(f"\n**AI-like Sound (Level {ai_like}/10):**")
-    if ai_like <= 2:
-        prompt_parts.append("Avoid any mechanical or robotic phrasing; sound completely human in the detected language.")
-    elif ai_like <= 5:
-        prompt_parts.append("Use some structured phrasing but maintain natural flow in the detected language.")
-    else:
-        prompt_parts.append("Use precise, structured language that sounds more systematic and analytical in the detected language.")
+    if not text_input:
+        return None, None, (jsonify({
+            'success': False, 
+            'error': 'Please provide text input or upload a text file'
+        }), 400)
     
-    prompt_parts.append(f"\n**Formality Level (Level {formality}/10):**")
-    if formality <= 2:
-        prompt_parts.append("Use very casual, informal language appropriate for friends or social media in the detected language.")
-    elif formality <= 5:
-        prompt_parts.append("Use moderately formal language suitable for business communication in the detected language.")
-    else:
-        prompt_parts.append("Use highly formal, academic or professional language in the detected language.")
+    if len(text_input) > MAX_TEXT_LENGTH:  # Limit text length
+        return None, None, (jsonify({
+            'success': False, 
+            'error': 'Text input too long. Maximum 10,000 characters allowed.'
+        }), 400)
     
-    prompt_parts.extend([
-        "\n**Text to process:**",
-        f"\n{text}",
-        "\n**Instructions:** Apply the above parameters to rewrite this text in the SAME language as the input. Maintain all cultural and linguistic nuances appropriate for that language. Return only the processed text without explanations."
-    ])
+    return text_input, sliders, None
+
+def build_messages(processing_prompt):
+    """Build the chat messages sent to OpenAI for a processing prompt"""
+    return [SYSTEM_MESSAGE, {"role": "user", "content": processing_prompt}]
+
+@retry(
+    wait=wait_random_exponential(min=1, max=20),
+    stop=stop_after_attempt(3),
+    retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError)),
+    reraise=True
+)
+async def call_openai(processing_prompt, max_tokens=MAX_OUTPUT_TOKENS, **kwargs):
+    """Request a chat completion, retrying transient API failures with backoff"""
+    return await client.chat.completions.create(
+        model="gpt-4o",
+        messages=build_messages(processing_prompt),
+        max_tokens=max_tokens,
+        temperature=0.7,
+        **kwargs
+    )
+
+def describe_openai_error(e):
+    """Map an exception raised by the OpenAI client to an (error message, status code) pair"""
+    if isinstance(e, openai.RateLimitError):
+        return 'API rate limit exceeded. Please try again later.', 429
+    if isinstance(e, openai.BadRequestError):
+        return f'Invalid request: {str(e)}', 400
+    logger.error("OpenAI API error: %s", e)
+    return 'Failed to process text. Please try again.', 500
+
+async def generate_processed_text(text, sliders):
+    """Rewrite text with OpenAI, returning (processed_text, truncated).
+
+    Starts with the estimated token budget and retries once with
+    MAX_OUTPUT_TOKENS if the rewrite was cut off (finish_reason 'length').
+    Truncated results must not be cached.
+    """
+    processing_prompt = create_processing_prompt(text, *sliders)
+    max_tokens = estimate_max_tokens(text)
+    response = await call_openai(processing_prompt, max_tokens)
+    if response.choices[0].finish_reason == 'length' and max_tokens < MAX_OUTPUT_TOKENS:
+        response = await call_openai(processing_prompt, MAX_OUTPUT_TOKENS)
     
-    return "".join(prompt_parts)
+    choice = response.choices[0]
+    return choice.message.content.strip(), choice.finish_reason == 'length'
 
-@app.route('/')
-def index():
-    return render_template('index.html')
+def openai_error_response(e):
+    """Map an exception raised by the OpenAI client to a JSON error response"""
+    error_msg, status = describe_openai_error(e)
+    return jsonify({'success': False, 'error': error_msg}), status
+
+def sse_event(payload):
+    """Format a payload as a server-sent event"""
+    return f"data: {app.json.dumps(payload)}\n\n"
 
 @app.route('/process', methods=['POST'])
-@limiter.limit("10 per minute")
-def process_text():
+async def process_text():
     try:
+        await consume_processing_quota()
+        
         # Check if OpenAI API key is configured
-        if not openai.api_key:
+        if client is None:
             return jsonify({
                 'success': False, 
                 'error': 'OpenAI API key not configured. Please contact administrator.'
             }), 500
         
-        # Get text input (either from form or file upload)
-        text_input = request.form.get('text_input', '').strip()
+        text_input, sliders, error_response = await parse_process_request()
+        if error_response:
+            return error_response
+        faithfulness, human_like, ai_like, formality = sliders
         
-        # Handle file upload
-        if 'file' in request.files:
-            file = request.files['file']
-            if file and file.filename and allowed_file(file.filename):
-                try:
-                    filename = secure_filename(file.filename)
-                    file_content = file.read().decode('utf-8')
-                    text_input = file_content if not text_input else text_input
-                except UnicodeDecodeError:
-                    return jsonify({
-                        'success': False, 
-                        'error': 'File must be valid UTF-8 text'
-                    }), 400
-        
-        if not text_input:
-            return jsonify({
-                'success': False, 
-                'error': 'Please provide text input or upload a text file'
-            }), 400
-        
-        if len(text_input) > 10000:  # Limit text length
-            return jsonify({
-                'success': False, 
-                'error': 'Text input too long. Maximum 10,000 characters allowed.'
-            }), 400
-        
-        # Validate slider values
-        is_valid, error_msg = validate_slider_values(request.form)
-        if not is_valid:
-            return jsonify({'success': False, 'error': error_msg}), 400
-        
-        # Get slider values
-        faithfulness = int(request.form.get('faithfulness'))
-        human_like = int(request.form.get('human_like'))
-        ai_like = int(request.form.get('ai_like'))
-        formality = int(request.form.get('formality'))
-        
-        # Create processing prompt
-        processing_prompt = create_processing_prompt(
-            text_input, faithfulness, human_like, ai_like, formality
-        )
+        # Serve identical requests from the cache without calling OpenAI
+        cache_key = make_cache_key(text_input, faithfulness, human_like, ai_like, formality)
+        processed_text = result_cache.get(cache_key)
+        if processed_text is not None:
+            logger.info("Serving processed text from cache")
+            return jsonify(build_result(text_input, processed_text, faithfulness, human_like, ai_like, formality, cached=True))
         
         # Call OpenAI API
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are an expert multilingual writing coach and text editor with deep expertise in grammar, style, clarity, and tone across all languages. You excel at improving text while respecting the author's voice, intent, and cultural context. You always respond in the same language as the input text and follow the given parameters precisely to enhance the provided text with professional writing standards appropriate for that language and culture."},
-                    {"role": "user", "content": processing_prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.7
-            )
-            
-            processed_text = response.choices[0].message.content.strip()
+            processed_text, truncated = await generate_processed_text(text_input, sliders)
+            if truncated:
+                logger.warning("Processed text truncated at %d tokens", MAX_OUTPUT_TOKENS)
+            else:
+                result_cache[cache_key] = processed_text
             
             # Log successful processing
-            logger.info(f"Text processed successfully. Length: {len(text_input)} -> {len(processed_text)}")
+            logger.info("Text processed successfully. Length: %d -> %d", len(text_input), len(processed_text))
             
+            return jsonify(build_result(text_input, processed_text, faithfulness, human_like, ai_like, formality, cached=False))
+            
+        except Exception as e:
+            return openai_error_response(e)
+            
+    except RateLimitExceeded:
+        raise
+    except Exception as e:
+        logger.error("Unexpected error in process_text: %s", e)
+        return jsonify({
+            'success': False, 
+            'error': 'An unexpected error occurred. Please try again.'
+        }), 500
+
+@app.route('/process/stream', methods=['POST'])
+async def process_text_stream():
+    """Stream the processed text as server-sent events while it is generated.
+
+    Each event carries a 'delta' chunk; the final event has 'done' set and the
+    complete 'processed_text', or an 'error' if generation failed midway. A
+    'reset' event means the output was cut off and generation restarted with a
+    larger token budget, so the deltas received so far should be discarded.
+    """
+    try:
+        await consume_processing_quota()
+        
+        # Check if OpenAI API key is configured
+        if client is None:
             return jsonify({
-                'success': True,
-                'original_text': text_input,
-                'processed_text': processed_text,
-                'parameters': {
-                    'faithfulness': faithfulness,
-                    'human_like': human_like,
-                    'ai_like': ai_like,
-                    'formality': formality
-                }
-            })
+                'success': False, 
+                'error': 'OpenAI API key not configured. Please contact administrator.'
+            }), 500
+        
+        text_input, sliders, error_response = await parse_process_request()
+        if error_response:
+            return error_response
+        
+        cache_key = make_cache_key(text_input, *sliders)
+        processed_text = result_cache.get(cache_key)
+        
+        if processed_text is not None:
+            logger.info("Serving processed text from cache")
             
-        except openai.error.RateLimitError:
+            async def generate():
+                yield sse_event({'delta': processed_text})
+                yield sse_event({'done': True, 'processed_text': processed_text, 'cached': True})
+        else:
+            processing_prompt = create_processing_prompt(text_input, *sliders)
+            max_tokens = estimate_max_tokens(text_input)
+            try:
+                stream = await call_openai(processing_prompt, max_tokens, stream=True)
+            except Exception as e:
+                return openai_error_response(e)
+            
+            async def generate():
+                nonlocal stream, max_tokens
+                try:
+                    while True:
+                        parts = []
+                        finish_reason = None
+                        # Closing the stream stops generation upstream if the client disconnects
+                        async with stream:
+                            async for chunk in stream:
+                                if not chunk.choices:
+                                    continue
+                                choice = chunk.choices[0]
+                                if choice.delta.content:
+                                    parts.append(choice.delta.content)
+                                    yield sse_event({'delta': choice.delta.content})
+                                if choice.finish_reason:
+                                    finish_reason = choice.finish_reason
+                        
+                        # Cut off by the estimated budget: start over with the full budget
+                        if finish_reason == 'length' and max_tokens < MAX_OUTPUT_TOKENS:
+                            yield sse_event({'reset': True})
+                            max_tokens = MAX_OUTPUT_TOKENS
+                            stream = await call_openai(processing_prompt, max_tokens, stream=True)
+                            continue
+                        break
+                except Exception as e:
+                    logger.error("OpenAI streaming error: %s", e)
+                    yield sse_event({'error': 'Failed to process text. Please try again.'})
+                    return
+                
+                processed_text = "".join(parts).strip()
+                if finish_reason == 'length':
+                    logger.warning("Streamed text truncated at %d tokens", MAX_OUTPUT_TOKENS)
+                else:
+                    result_cache[cache_key] = processed_text
+                logger.info("Text streamed successfully. Length: %d -> %d", len(text_input), len(processed_text))
+                yield sse_event({'done': True, 'processed_text': processed_text, 'cached': False})
+        
+        return generate(), 200, {
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+        
+    except RateLimitExceeded:
+        raise
+    except Exception as e:
+        logger.error("Unexpected error in process_text_stream: %s", e)
+        return jsonify({
+            'success': False, 
+            'error': 'An unexpected error occurred. Please try again.'
+        }), 500
+
+async def process_batch_item(text, sliders, semaphore):
+    """Process a single batch item, returning its result or error payload"""
+    cache_key = make_cache_key(text, *sliders)
+    processed_text = result_cache.get(cache_key)
+    if processed_text is not None:
+        return build_result(text, processed_text, *sliders, cached=True)
+    
+    async with semaphore:
+        try:
+            processed_text, truncated = await generate_processed_text(text, sliders)
+        except Exception as e:
+            error_msg, _ = describe_openai_error(e)
+            return {'success': False, 'error': error_msg}
+    
+    if not truncated:
+        result_cache[cache_key] = processed_text
+    return build_result(text, processed_text, *sliders, cached=False)
+
+@app.route('/process/batch', methods=['POST'])
+async def process_batch():
+    """Process several texts in one request, calling OpenAI concurrently.
+
+    Expects a JSON body {"items": [{"text": ..., "faithfulness": ..., ...}]}
+    and returns the results in the same order as the items. Each item counts
+    as one call against the client's processing limit.
+    """
+    try:
+        # Check if OpenAI API key is configured
+        if client is None:
             return jsonify({
                 'success': False, 
-                'error': 'API rate limit exceeded. Please try again later.'
-            }), 429
-        except openai.error.InvalidRequestError as e:
+                'error': 'OpenAI API key not configured. Please contact administrator.'
+            }), 500
+        
+        data = await request.get_json(silent=True)
+        items = data.get('items') if isinstance(data, dict) else None
+        if not isinstance(items, list) or not items:
             return jsonify({
                 'success': False, 
-                'error': f'Invalid request: {str(e)}'
+                'error': 'Please provide a non-empty list of items'
             }), 400
-        except Exception as e:
-            logger.error(f"OpenAI API error: {str(e)}")
+        
+        if len(items) > MAX_BATCH_ITEMS:
             return jsonify({
                 'success': False, 
-                'error': 'Failed to process text. Please try again.'
-            }), 500
+                'error': f'Too many items. Maximum {MAX_BATCH_ITEMS} items allowed per batch.'
+            }), 400
+        
+        # Validate every item before calling OpenAI for any of them
+        jobs = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                return jsonify({'success': False, 'error': f'Item {index}: must be an object'}), 400
+            
+            text = item.get('text')
+            if text is not None and not isinstance(text, str):
+                return jsonify({'success': False, 'error': f'Item {index}: text must be a string'}), 400
             
+            text = (text or '').strip()
+            if not text:
+                return jsonify({'success': False, 'error': f'Item {index}: text is required'}), 400
+            if len(text) > MAX_TEXT_LENGTH:
+                return jsonify({
+                    'success': False, 
+                    'error': f'Item {index}: text too long. Maximum 10,000 characters allowed.'
+                }), 400
+            
+            sliders, error_msg = validate_slider_values(item)
+            if error_msg:
+                return jsonify({'success': False, 'error': f'Item {index}: {error_msg}'}), 400
+            
+            jobs.append((text, sliders))
+        
+        await consume_processing_quota(len(jobs))
+        
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        results = await asyncio.gather(*[
+            process_batch_item(text, sliders, semaphore) for text, sliders in jobs
+        ])
+        
+        logger.info("Batch processed. Items: %d", len(results))
+        
+        return jsonify({'success': True, 'results': results})
+        
+    except RateLimitExceeded:
+        raise
     except Exception as e:
-        logger.error(f"Unexpected error in process_text: {str(e)}")
+        logger.error("Unexpected error in process_batch: %s", e)
         return jsonify({
             'success': False, 
             'error': 'An unexpected error occurred. Please try again.'
@@ -227,5 +632,6 @@ def ratelimit_handler(e):
     }), 429
 
 if __name__ == '__main__':
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_ENV') == 'development')
@@ -0,0 +1,32 @@
+import multiprocessing
+import os
+
+# Production server configuration (used by `gunicorn app:app`)
+# Uvicorn workers run the Quart app on an asyncio event loop, so each worker
+# can have many OpenAI calls in flight at once instead of one per worker.
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+worker_class = 'uvicorn_worker.UvicornWorker'
+
+# Rate limits (and the result cache) live in each worker's memory unless REDIS_URL
+# is set, so without Redis a single worker is the default; otherwise every worker
+# would allow a client the full limit.
+if os.environ.get('REDIS_URL'):
+    default_workers = multiprocessing.cpu_count() * 2 + 1
+else:
+    default_workers = 1
+workers = int(os.environ.get('WEB_CONCURRENCY', default_workers))
+keepalive = 5
+
+# Only trust X-Forwarded-For from these proxy addresses (comma-separated IPs or
+# CIDR ranges). Uvicorn then sets the client address from the header, which the
+# rate limits key on; requests from anywhere else keep their peer address.
+forwarded_allow_ips = os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1,::1')
+
+
+def when_ready(server):
+    if workers > 1 and not os.environ.get('REDIS_URL'):
+        server.log.warning(
+            "Running %d workers without REDIS_URL: rate limits are kept per worker, "
+            "so each client gets %dx the configured limits. Set REDIS_URL or use one worker.",
+            workers, workers
+        )